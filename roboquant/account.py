@@ -121,6 +121,8 @@ class Account:
         self.orders: list[Order] = []
         self.last_update: datetime = datetime.fromisoformat("1900-01-01T00:00:00+00:00")
         self.cash: float = 0.0
+        self._mkt_value: float = 0.0
+        self._mkt_value_time: datetime | None = None
 
     @staticmethod
     def register_converter(converter: Converter):
@@ -137,11 +139,17 @@ class Account:
         """Return the sum market values of the open positions in the account.
 
         The returned value is denoted in the base currency of the account.
+        Since the account only changes when the broker syncs it, the value is calculated
+        once per sync and cached afterwards. So traders and journals can invoke this
+        method (or `equity`) repeatedly without paying for the summation each time.
         """
-        return sum(
-            [self.contract_value(symbol, pos.size, pos.mkt_price) for symbol, pos in self.positions.items()],
-            0.0,
-        )
+        if self._mkt_value_time != self.last_update:
+            self._mkt_value = sum(
+                [self.contract_value(symbol, pos.size, pos.mkt_price) for symbol, pos in self.positions.items()],
+                0.0,
+            )
+            self._mkt_value_time = self.last_update
+        return self._mkt_value
 
     def position_value(self, symbol) -> float:
         """Return position value denoted in the base currency of the account.
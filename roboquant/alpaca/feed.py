@@ -1,5 +1,6 @@
 from array import array
 from datetime import timedelta
+from functools import lru_cache
 import threading
 from typing import Literal
 import numpy as np
@@ -29,6 +30,12 @@ from roboquant.feeds.historic import HistoricFeed
 from roboquant.feeds.live import LiveFeed
 
 
+@lru_cache(maxsize=1)
+def _config() -> Config:
+    """Return a shared Config instance, so the configuration file isn't re-read for every feed"""
+    return Config()
+
+
 class AlpacaLiveFeed(LiveFeed):
     """Subscribe to live market data for stocks, crypto currencies or options"""
 
@@ -36,7 +43,7 @@ class AlpacaLiveFeed(LiveFeed):
 
     def __init__(self, market: Literal["iex", "sip", "crypto", "option"] = "iex", api_key=None, secret_key=None) -> None:
         super().__init__()
-        config = Config()
+        config = _config()
         api_key = api_key or config.get("alpaca.public.key")
         secret_key = secret_key or config.get("alpaca.secret.key")
         match market:
@@ -66,11 +73,12 @@ class AlpacaLiveFeed(LiveFeed):
         self.__put_item(data.timestamp, item)
 
     async def __handle_bars(self, data):
-        item = Bar(data.symbol, array("f", [data.open, data.high, data.low, data.close, data.volume]), self.__one_minute)
+        ohlcv = np.array((data.open, data.high, data.low, data.close, data.volume), dtype=np.float32)
+        item = Bar(data.symbol, ohlcv, self.__one_minute)
         self.__put_item(data.timestamp, item)
 
     async def __handle_quotes(self, data):
-        item = Quote(data.symbol, array("f", [data.ask_price, data.ask_size, data.bid_price, data.bid_size]))
+        item = Quote(data.symbol, np.array((data.ask_price, data.ask_size, data.bid_price, data.bid_size), dtype=np.float32))
         self.__put_item(data.timestamp, item)
 
     def subscribe_trades(self, *symbols: str):
@@ -119,7 +127,7 @@ class AlpacaHistoricStockFeed(_AlpacaHistoricFeed):
 
     def __init__(self, api_key=None, secret_key=None, data_api_url=None, feed: DataFeed | None = None):
         super().__init__()
-        config = Config()
+        config = _config()
         api_key = api_key or config.get("alpaca.public.key")
         secret_key = secret_key or config.get("alpaca.secret.key")
         self.client = StockHistoricalDataClient(api_key, secret_key, url_override=data_api_url)
@@ -162,7 +170,7 @@ class AlpacaHistoricCryptoFeed(_AlpacaHistoricFeed):
 
     def __init__(self, api_key=None, secret_key=None, data_api_url=None):
         super().__init__()
-        config = Config()
+        config = _config()
         api_key = api_key or config.get("alpaca.public.key")
         secret_key = secret_key or config.get("alpaca.secret.key")
         self.client = CryptoHistoricalDataClient(api_key, secret_key, url_override=data_api_url)
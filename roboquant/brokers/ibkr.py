@@ -31,6 +31,8 @@ class _IBApi(EWrapper, EClient):
         self.__account = {AccountSummaryTags.TotalCashValue: 0.0, AccountSummaryTags.BuyingPower: 0.0}
         self.__account_end = threading.Condition()
         self.__order_id = 0
+        self.__pending_order_ids: set[str] = set()
+        self.__order_update = threading.Condition()
 
     def nextValidId(self, orderId: int):
         self.__order_id = orderId
@@ -69,6 +71,24 @@ class _IBApi(EWrapper, EClient):
         rq_order = Order(symbol, size) if not order.lmtPrice else Order(symbol, size, order.lmtPrice)
         rq_order.id = str(orderId)
         self.orders[rq_order.id] = rq_order
+        self._ack_order(rq_order.id)
+
+    def _ack_order(self, order_id: str):
+        """Mark an order as acknowledged by the server and wake up any waiting threads"""
+        with self.__order_update:
+            self.__pending_order_ids.discard(order_id)
+            self.__order_update.notify_all()
+
+    def add_pending_order(self, order_id: str):
+        """Register an order id for which an acknowledgment is expected"""
+        with self.__order_update:
+            self.__pending_order_ids.add(order_id)
+
+    def wait_for_pending_orders(self, timeout: float | None = None) -> bool:
+        """Block until all pending orders have been acknowledged, or the timeout in seconds expires.
+        Returns True if no orders are pending anymore."""
+        with self.__order_update:
+            return self.__order_update.wait_for(lambda: not self.__pending_order_ids, timeout)
 
     def request_account(self):
         """blocking call till account summary has been received"""
@@ -102,6 +122,7 @@ class _IBApi(EWrapper, EClient):
     ):
         logger.debug("order status orderId=%s status=%s fill=%s", orderId, status, filled)
         orderId = str(orderId)
+        self._ack_order(orderId)
         if orderId in self.orders:
             order = self.orders[orderId]
             order.fill = filled
@@ -203,6 +224,7 @@ class IBKRBroker(LiveBroker):
             assert order.is_open, "can only place open orders"
             if order.size.is_zero():
                 assert order.id is not None, "can only cancel orders with an id"
+                self.__api.add_pending_order(order.id)
                 self.__api.cancelOrder(int(order.id), "")
                 if self.sleep_after_cancel:
                     time.sleep(self.sleep_after_cancel)
@@ -212,8 +234,18 @@ class IBKRBroker(LiveBroker):
                     self.__api.orders[order.id] = order
                 ibkr_order = self._get_order(order)
                 contract = self._get_contract(order)
+                self.__api.add_pending_order(order.id)
                 self.__api.placeOrder(int(order.id), contract, ibkr_order)
 
+    def wait_for_orders(self, timeout: float = 5.0) -> bool:
+        """Block until every order placed via place_orders has been acknowledged by the server,
+        or the timeout in seconds expires. Returns True if no acknowledgments are outstanding.
+
+        This replaces sleeping a fixed amount of time after placing orders and typically
+        returns within a fraction of a second.
+        """
+        return self.__api.wait_for_pending_orders(timeout)
+
     @staticmethod
     def __update_ibkr_object(obj, update):
         if not update:
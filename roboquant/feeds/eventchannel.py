@@ -1,9 +1,13 @@
+import logging
+import threading
 from datetime import datetime, timezone
-from queue import Empty, Queue
+from queue import Empty, Full, Queue
 
 from roboquant.event import Event
 from roboquant.timeframe import Timeframe
 
+logger = logging.getLogger(__name__)
+
 
 class ChannelClosed(Exception):
     """Thrown when the channel is already closed and trying to put a new event on the channel."""
@@ -24,7 +28,7 @@ class EventChannel:
 
         self.timeframe = timeframe
         self._queue = Queue(maxsize)
-        self._closed = False
+        self._close_event = threading.Event()
 
     @property
     def maxsize(self):
@@ -37,7 +41,7 @@ class EventChannel:
         - If the event is after the timeframe of this channel, the channel will be closed.
         - If the channel is already closed, a ChannelClosed exception will be raised.
         """
-        if self._closed:
+        if self.is_closed:
             raise ChannelClosed()
 
         if self.timeframe is None or event.time in self.timeframe:
@@ -47,6 +51,23 @@ class EventChannel:
             # the event is past the provided timeframe.
             self.close()
 
+    def put_nowait(self, event: Event):
+        """Put an event on this channel without ever blocking the calling thread.
+
+        The behavior is the same as `put`, except that the event is dropped when the channel is full.
+        Live feeds use this method so a slow consumer cannot stall the thread that receives the market data.
+        """
+        if self.is_closed:
+            raise ChannelClosed()
+
+        if self.timeframe is None or event.time in self.timeframe:
+            try:
+                self._queue.put_nowait(event)
+            except Full:
+                logger.warning("dropped event time=%s because the channel was full", event.time)
+        elif not event.time < self.timeframe.start:
+            self.close()
+
     def get(self, timeout=None) -> Event | None:
         """Returns the next event or None if this channel is just closed
 
@@ -60,19 +81,27 @@ class EventChannel:
             if self.timeframe is None or now in self.timeframe:
                 return Event.empty(now)
 
-            self._closed = True
+            self._close_event.set()
         return None
 
     def close(self):
         """close this channel and put a None message on the channel to indicate to consumers it is closed"""
-        if not self._closed:
-            self._closed = True
+        if not self.is_closed:
+            self._close_event.set()
             self._queue.put(None)
 
     def copy(self):
         return EventChannel(self.timeframe, self._queue.maxsize)
 
+    def wait_for_close(self, timeout: float | None = None) -> bool:
+        """Block until this channel is closed, or the optional timeout in seconds expires.
+        Returns True if the channel is closed.
+
+        This blocks in the kernel rather than polling `is_closed`, so waiting threads use no CPU.
+        """
+        return self._close_event.wait(timeout)
+
     @property
     def is_closed(self) -> bool:
         """Returns true if this channel is closed and no more new events will be put on this channel"""
-        return self._closed
+        return self._close_event.is_set()
@@ -1,5 +1,6 @@
 import json
 import pathlib
+from functools import lru_cache
 
 from roboquant.event import Bar
 from roboquant.feeds.feed import Feed
@@ -26,13 +27,18 @@ def get_ohlcv(feed: Feed, symbol: str, timeframe: Timeframe | None = None) -> di
     return result
 
 
-def get_sp500_symbols():
+@lru_cache(maxsize=1)
+def _load_sp500_symbols() -> tuple[str, ...]:
     full_path = pathlib.Path(__file__).parent.resolve().joinpath("sp500.json")
     with open(full_path, encoding="utf8") as f:
-        content = f.read()
-        j = json.loads(content)
-        symbols = [elem["Symbol"] for elem in j]
-        return symbols
+        j = json.load(f)
+        return tuple(elem["Symbol"] for elem in j)
+
+
+def get_sp500_symbols():
+    """Return the S&P 500 symbols as a list.
+    The underlying file is only read and parsed once, repeated calls return a fresh copy."""
+    return list(_load_sp500_symbols())
 
 
 def print_feed_items(feed: Feed, timeframe: Timeframe | None = None, timeout: float | None = None):
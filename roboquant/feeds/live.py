@@ -1,5 +1,4 @@
 from datetime import datetime, timedelta
-import time
 
 from roboquant.event import Event
 from .eventchannel import ChannelClosed, EventChannel
@@ -25,8 +24,7 @@ class LiveFeed(Feed):
 
     def play(self, channel: EventChannel):
         self._channel = channel
-        while not channel.is_closed:
-            time.sleep(1)
+        channel.wait_for_close()
         self._channel = None
 
     def put(self, event: Event):
@@ -34,7 +32,7 @@ class LiveFeed(Feed):
             try:
                 if event.time <= self._last_time:
                     event.time = self._last_time + self.increment
-                self._channel.put(event)
+                self._channel.put_nowait(event)
                 self._last_time = event.time
             except ChannelClosed:
                 pass
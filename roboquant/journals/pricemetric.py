@@ -6,16 +6,22 @@ class PriceItemMetric(Metric):
     """
 
     def __init__(self, *symbols: str, price_type="DEFAULT", volume_type="DEFAULT"):
-        self.symbols = symbols
+        self.symbols = frozenset(symbols)
         self.price_type = price_type
         self.volume_type = volume_type
+        self._all = not symbols
+        self._prefixes: dict[str, str] = {}
 
     def calc(self, event, account, signals, orders) -> dict[str, float]:
         result = {}
+        prefixes = self._prefixes
         for symbol, item in event.price_items.items():
-            if symbol in self.symbols or not self.symbols:
-                prefix = f"item/{symbol.lower()}"
-                result[f"{prefix}/price"] = item.price(self.price_type)
-                result[f"{prefix}/volume"] = item.volume(self.volume_type)
+            if not self._all and symbol not in self.symbols:
+                continue
+            prefix = prefixes.get(symbol)
+            if prefix is None:
+                prefix = prefixes[symbol] = f"item/{symbol.lower()}"
+            result[f"{prefix}/price"] = item.price(self.price_type)
+            result[f"{prefix}/volume"] = item.volume(self.volume_type)
 
         return result
@@ -1,12 +1,11 @@
 from abc import abstractmethod
-from collections import deque
 from datetime import datetime
 import logging
 import numpy as np
 from numpy.typing import NDArray
 from stable_baselines3.common.policies import BasePolicy
 import torch
-from torch.utils.data import DataLoader, Dataset
+from torch.utils.data import DataLoader, TensorDataset
 
 from roboquant.event import Event
 from roboquant.ml.envs import Action2Orders, Action2Signals, StrategyEnv, TraderEnv
@@ -34,7 +33,8 @@ class SB3PolicyStrategy(Strategy):
 
     def create_signals(self, event):
         obs = self.obs_feature.calc(event, None)
-        if np.any(np.isnan(obs)):
+        if np.isnan(obs.sum()):
+            # a NaN propagates through the sum, so this is a single pass over obs
             return []
         action, self.state = self.policy.predict(obs, state=self.state, deterministic=True)  # type: ignore
         logger.debug(action)
@@ -60,7 +60,7 @@ class SB3PolicyTrader(Trader):
 
     def create_orders(self, signals, event, account) -> list[Order]:
         obs = self.obs_feature.calc(event, account)
-        if np.any(np.isnan(obs)):
+        if np.isnan(obs.sum()):
             return []
         action, self.state = self.policy.predict(obs, state=self.state, deterministic=True)  # type: ignore
         return self.action_2_orders.get_orders(action, event, account)
@@ -79,15 +79,21 @@ class FeatureStrategy(Strategy):
     def __init__(self, input_feature: Feature, history: int, dtype="float32"):
         self.input_feature = input_feature
         self.history = history
-        self._hist = deque(maxlen=history)
+        self._buffer: NDArray | None = None
+        self._cnt = 0
         self._dtype = dtype
 
     def create_signals(self, event: Event):
-        h = self._hist
         row = self.input_feature.calc(event, None)
-        h.append(row)
-        if len(h) == h.maxlen:
-            x = np.asarray(h, dtype=self._dtype)
+        if self._buffer is None:
+            # allocate the history buffer once, it is reused as a circular buffer afterwards
+            self._buffer = np.empty((self.history, row.shape[0]), dtype=self._dtype)
+
+        self._buffer[self._cnt % self.history] = row
+        self._cnt += 1
+        if self._cnt >= self.history:
+            idx = self._cnt % self.history
+            x = np.concatenate((self._buffer[idx:], self._buffer[:idx]))
             return self.predict(x, event.time)
         return []
 
@@ -95,28 +101,17 @@ class FeatureStrategy(Strategy):
     def predict(self, x: NDArray, time: datetime) -> list[Signal]: ...
 
 
-class SequenceDataset(Dataset):
-    """Sequence Dataset"""
+def _sequence_dataset(x_data: NDArray, y_data: NDArray, sequences: int) -> TensorDataset:
+    """Return a dataset with all sliding windows of `sequences` rows over x_data,
+    each labeled with the y_data value at the end of the window.
 
-    def __init__(self, x_data: NDArray, y_data: NDArray, sequences=20, transform=None, target_transform=None):
-        self.sequences = sequences
-        self.x_data = x_data
-        self.y_data = y_data
-        self.transform = transform
-        self.target_transform = target_transform
-
-    def __len__(self):
-        return len(self.y_data) - self.sequences
-
-    def __getitem__(self, idx):
-        end = idx + self.sequences
-        features = self.x_data[idx:end]
-        target = self.y_data[end - 1]
-        if self.transform:
-            features = self.transform(features)
-        if self.target_transform:
-            target = self.target_transform(target)
-        return features, target
+    The windows are a zero-copy strided view, so assembling a batch is a single C-level
+    gather instead of one Python `__getitem__` call per sample. The view is only read,
+    never written to.
+    """
+    x_win = np.lib.stride_tricks.sliding_window_view(x_data, sequences, axis=0, writeable=True)
+    x_win = np.moveaxis(x_win, -1, 1)
+    return TensorDataset(torch.from_numpy(x_win), torch.from_numpy(y_data[sequences - 1:]))
 
 
 class RNNStrategy(FeatureStrategy):
@@ -130,21 +125,31 @@ class RNNStrategy(FeatureStrategy):
         sequences: int = 20,
         buy_pct: float = 0.01,
         sell_pct=0.0,
+        compile_model=False,
     ):
         super().__init__(input_feature, sequences)
         self.label_feature = label_feature
-        self.model = model
+        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        self.model = model.to(self.device)
         self.buy_pct = buy_pct
         self.sell_pct = sell_pct
         self.symbol = symbol
 
+        if compile_model:
+            # predict always runs with the same (1, sequences, features) shape, so the
+            # compiled graph needs only a single specialization
+            try:
+                self.model = torch.compile(self.model, mode="reduce-overhead", dynamic=False)  # type: ignore
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.warning("torch.compile not available, using the eager model")
+
     def predict(self, x, time):
-        x = torch.asarray(x)
-        x = torch.unsqueeze(x, dim=0)  # add the batch dimension
+        tensor = torch.from_numpy(x).unsqueeze_(0)  # add the batch dimension, in-place
+        tensor = tensor.to(self.device)
 
         self.model.eval()
-        with torch.no_grad():
-            output = self.model(x).numpy()
+        with torch.inference_mode():
+            output = self.model(tensor).cpu().numpy()
 
             if isinstance(self.label_feature, NormalizeFeature):
                 p = self.label_feature.denormalize(output).item()
@@ -166,32 +171,35 @@ class RNNStrategy(FeatureStrategy):
         x_train = x[: border - prediction]
         y_train = y[prediction:border]
 
-        train_dataset = SequenceDataset(x_train, y_train, self.history)
-        train_dataloader = DataLoader(train_dataset, batch_size=batch_size, shuffle=True)
+        pin_memory = self.device.type == "cuda"
+        train_dataset = _sequence_dataset(x_train, y_train, self.history)
+        train_dataloader = DataLoader(train_dataset, batch_size=batch_size, shuffle=True, pin_memory=pin_memory)
 
         valid_dataloader = None
         if validation_split > 0.0:
             x_valid = x[border - prediction: -prediction]
             y_valid = y[border:]
-            valid_dataset = SequenceDataset(x_valid, y_valid, self.history)
-            valid_dataloader = DataLoader(valid_dataset, batch_size=batch_size, shuffle=False)
+            valid_dataset = _sequence_dataset(x_valid, y_valid, self.history)
+            valid_dataloader = DataLoader(valid_dataset, batch_size=batch_size, shuffle=False, pin_memory=pin_memory)
 
         return train_dataloader, valid_dataloader
 
     def __get_xy(self, feed, timeframe=None, warmup=0) -> tuple[NDArray, NDArray]:
         channel = feed.play_background(timeframe)
+        calc_x = self.input_feature.calc
+        calc_y = self.label_feature.calc
         x = []
         y = []
         while evt := channel.get():
             if warmup:
-                self.label_feature.calc(evt, None)
-                self.input_feature.calc(evt, None)
+                calc_y(evt, None)
+                calc_x(evt, None)
                 warmup -= 1
             else:
-                x.append(self.input_feature.calc(evt, None))
-                y.append(self.label_feature.calc(evt, None))
+                x.append(calc_x(evt, None))
+                y.append(calc_y(evt, None))
 
-        return np.asarray(x, dtype=self._dtype), np.asarray(y, dtype=self._dtype)
+        return np.stack(x).astype(self._dtype, copy=False), np.stack(y).astype(self._dtype, copy=False)
 
     @staticmethod
     def describe(x):
@@ -249,17 +257,25 @@ class RNNStrategy(FeatureStrategy):
         if writer:
             writer.flush()
 
+    def _use_amp(self):
+        """Use bfloat16 mixed precision on the GPU, full precision otherwise"""
+        return self.device.type == "cuda"
+
     def _train_epoch(self, data_loader, opt, crit):
         model = self.model
         model.train()
-        b, total_loss = 0, torch.tensor([0.0])
+        use_amp = self._use_amp()
+        b, total_loss = 0, torch.zeros((), device=self.device)
         for inputs, labels in data_loader:
+            inputs = inputs.to(self.device, non_blocking=True)
+            labels = labels.to(self.device, non_blocking=True)
             opt.zero_grad()
-            output = model(inputs)
-            loss = crit(output, labels)
+            with torch.autocast(device_type=self.device.type, dtype=torch.bfloat16, enabled=use_amp):
+                output = model(inputs)
+                loss = crit(output, labels)
             loss.backward()
             opt.step()
-            total_loss += loss.detach()
+            total_loss.add_(loss.detach())
             b += 1
 
         return (total_loss / b).item()
@@ -267,12 +283,16 @@ class RNNStrategy(FeatureStrategy):
     def _valid_epoch(self, data_loader, crit):
         model = self.model
         model.eval()
-        b, total_loss = 0, torch.tensor([0.0])
+        use_amp = self._use_amp()
+        b, total_loss = 0, torch.zeros((), device=self.device)
         with torch.no_grad():
             for inputs, labels in data_loader:
-                output = model(inputs)
-                loss = crit(output, labels)
-                total_loss += loss.detach()
+                inputs = inputs.to(self.device, non_blocking=True)
+                labels = labels.to(self.device, non_blocking=True)
+                with torch.autocast(device_type=self.device.type, dtype=torch.bfloat16, enabled=use_amp):
+                    output = model(inputs)
+                    loss = crit(output, labels)
+                total_loss.add_(loss.detach())
                 b += 1
 
         return (total_loss / b).item()
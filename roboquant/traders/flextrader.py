@@ -2,8 +2,11 @@ from datetime import datetime, timedelta
 import logging
 from decimal import Decimal
 from enum import Flag, auto
+from itertools import chain
 import random
 
+import numpy as np
+
 from roboquant.event import Event
 from roboquant.order import Order
 from roboquant.signal import Signal
@@ -13,6 +16,8 @@ from ..event import PriceItem
 
 logger = logging.getLogger(__name__)
 
+_ONE = Decimal(1)
+
 
 class _PositionChange(Flag):
     ENTRY_LONG = auto()
@@ -36,32 +41,31 @@ class _PositionChange(Flag):
     @staticmethod
     def get_change(is_buy: bool, pos_size: Decimal) -> "_PositionChange":
         """Determine the kind of change a certain action would have on the position"""
-        if pos_size.is_zero():
-            return _PositionChange.ENTRY_LONG if is_buy else _PositionChange.ENTRY_SHORT
-        if pos_size > 0:
-            return _PositionChange.ENTRY_LONG if is_buy else _PositionChange.EXIT_LONG
-
-        return _PositionChange.EXIT_SHORT if is_buy else _PositionChange.ENTRY_SHORT
+        sign_idx = 0 if not pos_size else (1 if pos_size > 0 else 2)
+        return _CHANGE_TABLE[sign_idx][is_buy]
 
 
-class _Context:
+# the position change for (flat, long, short) positions, indexed by [sign_idx][is_buy]
+_CHANGE_TABLE = (
+    (_PositionChange.ENTRY_SHORT, _PositionChange.ENTRY_LONG),
+    (_PositionChange.EXIT_LONG, _PositionChange.ENTRY_LONG),
+    (_PositionChange.ENTRY_SHORT, _PositionChange.EXIT_SHORT),
+)
 
-    def __init__(self, signal: Signal, position: Decimal) -> None:
-        self.signal = signal
-        self.position = position
 
-    def log(self, rule: str, **kwargs):
-        if logger.isEnabledFor(logging.INFO):
-            extra = ' '.join(f"{k}={v}" for k, v in kwargs.items())
-            logger.info(
-                "Discarded signal because %s [symbol=%s rating=%s type=%s position=%s %s]",
-                rule,
-                self.signal.symbol,
-                self.signal.rating,
-                self.signal.type,
-                self.position,
-                extra,
-            )
+def _log_discard(rule: str, signal: Signal, position: Decimal, **kwargs):
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    extra = ' '.join(f"{k}={v}" for k, v in kwargs.items())
+    logger.info(
+        "Discarded signal because %s [symbol=%s rating=%s type=%s position=%s %s]",
+        rule,
+        signal.symbol,
+        signal.rating,
+        signal.type,
+        position,
+        extra,
+    )
 
 
 class FlexTrader(Trader):
@@ -88,6 +92,19 @@ class FlexTrader(Trader):
         logging.getLogger("roboquant.traders.flextrader").setLevel(logging.INFO)
     """
 
+    __slots__ = (
+        "one_order_only",
+        "size_digits",
+        "safety_margin_perc",
+        "shorting",
+        "max_order_perc",
+        "min_order_perc",
+        "max_position_perc",
+        "price_type",
+        "shuffle_signals",
+        "_rng",
+    )
+
     def __init__(
         self,
         one_order_only=True,
@@ -110,20 +127,72 @@ class FlexTrader(Trader):
         self.max_position_perc = max_position_perc
         self.price_type = price_type
         self.shuffle_signals = shuffle_signals
+        self._rng = random.Random()
 
     def _get_order_size(self, rating: float, contract_price: float, max_order_value: float) -> Decimal:
         """Return the order size"""
-        size = Decimal(rating * max_order_value / contract_price)
-        rounded_size = round(size, self.size_digits)
-        return rounded_size
+        size = round(rating * max_order_value / contract_price, self.size_digits)
+        return Decimal(str(size))
+
+    def _filter_signals(self, signals: list[Signal], event: Event, account: Account) -> list[tuple[Signal, Decimal]]:
+        """Evaluate the discard rules that don't depend on order values for all signals at once.
+
+        Returns the surviving signals together with their current position size. The per-signal
+        predicates are combined as vectorized boolean masks, so the order-creation loop only
+        runs for signals that can actually result in an order.
+        """
+        # signals without a price in the event can never result in an order, so drop them
+        # with a single dict-membership test each before doing any other per-signal work
+        have_price = event.price_items.keys()
+        if logger.isEnabledFor(logging.INFO):
+            for signal in signals:
+                if signal.symbol not in have_price:
+                    _log_discard("no price is available", signal, account.get_position_size(signal.symbol))
+        signals = [signal for signal in signals if signal.symbol in have_price]
+        if not signals:
+            return []
+
+        n = len(signals)
+        pos_sizes = [account.get_position_size(signal.symbol) for signal in signals]
+        # the mask only tests the sign of the position, so single precision is plenty;
+        # the actual order sizing further down still runs with Decimal precision
+        pos = np.fromiter(map(float, pos_sizes), dtype=np.float32, count=n)
+        is_buy = np.fromiter((signal.is_buy for signal in signals), dtype=np.bool_, count=n)
+        is_exit_change = ((pos > 0.0) & ~is_buy) | ((pos < 0.0) & is_buy)
+
+        # reason code 0 means the signal is accepted, the codes follow the rule order of the old loop
+        reason = np.zeros(n, dtype=np.int8)
+
+        if self.one_order_only:
+            open_symbols = {order.symbol for order in account.orders if order.is_open}
+            if open_symbols:
+                has_open = np.fromiter((signal.symbol in open_symbols for signal in signals), dtype=np.bool_, count=n)
+                reason[(reason == 0) & has_open] = 1
+
+        if not self.shorting:
+            entry_short = ~is_buy & (pos <= 0.0)
+            reason[(reason == 0) & entry_short] = 2
+
+        signal_is_exit = np.fromiter((signal.is_exit for signal in signals), dtype=np.bool_, count=n)
+        reason[(reason == 0) & is_exit_change & ~signal_is_exit] = 3
+
+        signal_is_entry = np.fromiter((signal.is_entry for signal in signals), dtype=np.bool_, count=n)
+        reason[(reason == 0) & ~is_exit_change & ~signal_is_entry] = 4
+
+        if logger.isEnabledFor(logging.INFO):
+            rules = ("one order only", "no shorting", "no exit signal", "no entry signal")
+            for i in np.nonzero(reason)[0]:
+                _log_discard(rules[reason[i] - 1], signals[i], pos_sizes[i])
+
+        return [(signals[i], pos_sizes[i]) for i in np.nonzero(reason == 0)[0]]
 
     def create_orders(self, signals: list[Signal], event: Event, account: Account) -> list[Order]:
-        # pylint: disable=too-many-branches,too-many-statements,too-many-locals
         if not signals:
             return []
 
         if self.shuffle_signals:
-            random.shuffle(signals)
+            # sample returns a shuffled copy, so the list the caller passed in stays untouched
+            signals = self._rng.sample(signals, len(signals))
 
         orders: list[Order] = []
         equity = account.equity()
@@ -132,89 +201,111 @@ class FlexTrader(Trader):
         max_pos_value = equity * self.max_position_perc
         available = account.buying_power - self.safety_margin_perc * equity
 
-        for signal in signals:
-            symbol = signal.symbol
-            pos_size = account.get_position_size(symbol)
-            ctx = _Context(signal, pos_size)
+        candidates = self._filter_signals(signals, event, account)
+        info_enabled = logger.isEnabledFor(logging.INFO)
 
-            change = _PositionChange.get_change(signal.is_buy, pos_size)
-
-            logger.info("available=%s signal=%s pos=%s change=%s", available, signal, pos_size, change)
+        # resolve the position value and the value of a single contract per symbol once,
+        # rather than once per signal inside the loop
+        pos_values = {symbol: abs(account.position_value(symbol)) for symbol in account.positions}
+        multipliers = {symbol: account.contract_value(symbol, _ONE, 1.0) for symbol in {s.symbol for s, _ in candidates}}
 
-            if self.one_order_only and account.has_open_order(symbol):
-                ctx.log("one order only")
+        # map phase: evaluate each candidate against the rules; the only sequential part is
+        # the reduce phase below, where the buying power is decremented in signal order
+        for signal, pos_size in candidates:
+            result = self._evaluate_signal(
+                signal, pos_size, event, available, min_order_value, max_order_value, max_pos_value,
+                pos_values, multipliers, info_enabled
+            )
+            if result is None:
                 continue
 
-            item = event.price_items.get(symbol)
-            if item is None:
-                ctx.log("no price is available")
-                continue
+            new_orders, order_value = result
+            orders += new_orders
+            available -= order_value
 
-            price = item.price(self.price_type)
+        return orders
 
-            if not self.shorting and change == _PositionChange.ENTRY_SHORT:
-                ctx.log("no shorting")
-                continue
+    def _evaluate_signal(
+        self,
+        signal: Signal,
+        pos_size: Decimal,
+        event: Event,
+        available: float,
+        min_order_value: float,
+        max_order_value: float,
+        max_pos_value: float,
+        pos_values: dict[str, float],
+        multipliers: dict[str, float],
+        info_enabled: bool,
+    ) -> tuple[list[Order], float] | None:
+        """Evaluate a single signal and return the resulting orders plus the buying power they
+        consume, or None when the signal is discarded. This method doesn't mutate any state.
+        """
+        # pylint: disable=too-many-return-statements
+        symbol = signal.symbol
+        rating = signal.rating
+        change = _PositionChange.get_change(rating > 0.0, pos_size)
 
-            if change.is_exit:
-                # Closing orders don't require or use buying power
-                if not signal.is_exit:
-                    ctx.log("no exit signal")
-                    continue
-
-                rounded_size = round(-pos_size * abs(Decimal(signal.rating)), self.size_digits)
-                if rounded_size.is_zero():
-                    ctx.log("cannot exit with order size zero")
-                    continue
-                new_orders = self._get_orders(symbol, rounded_size, item, signal, event.time)
-                orders += new_orders
-            else:
-                if available < 0:
-                    ctx.log("no more available buying power")
-                    continue
-
-                if not signal.is_entry:
-                    ctx.log("no entry signal")
-                    continue
-
-                if available < min_order_value:
-                    ctx.log("available buying power below minimum order value")
-                    continue
-
-                available_order_value = min(available, max_order_value, max_pos_value - abs(account.position_value(symbol)))
-                if available_order_value < min_order_value:
-                    ctx.log("calculated available order value below minimum order value")
-                    continue
-
-                contract_price = account.contract_value(symbol, Decimal(1), price)
-                order_size = self._get_order_size(signal.rating, contract_price, available_order_value)
-
-                if order_size.is_zero():
-                    ctx.log("calculated order size is zero")
-                    continue
-
-                order_value = abs(account.contract_value(symbol, order_size, price))
-                if abs(order_value) > available:
-                    ctx.log(
-                        "order value above available buying power",
-                        order_value=order_value,
-                        available=available,
-                    )
-                    continue
-                if abs(order_value) < min_order_value:
-                    ctx.log(
-                        "order value below minimum order value",
-                        order_value=order_value,
-                        min_order_value=min_order_value,
-                    )
-                    continue
-
-                new_orders = self._get_orders(symbol, order_size, item, signal, event.time)
-                if new_orders:
-                    orders += new_orders
-                    available -= order_value
+        if info_enabled:
+            logger.info("available=%s signal=%s pos=%s change=%s", available, signal, pos_size, change)
 
-        return orders
+        item = event.price_items[symbol]
+        price = item.price(self.price_type)
+
+        if change.is_exit:
+            # Closing orders don't require or use buying power
+            rounded_size = Decimal(str(round(-float(pos_size) * abs(rating), self.size_digits)))
+            if rounded_size.is_zero():
+                _log_discard("cannot exit with order size zero", signal, pos_size)
+                return None
+            return self._get_orders(symbol, rounded_size, item, signal, event.time), 0.0
+
+        if available < 0:
+            _log_discard("no more available buying power", signal, pos_size)
+            return None
+
+        if available < min_order_value:
+            _log_discard("available buying power below minimum order value", signal, pos_size)
+            return None
+
+        available_order_value = min(available, max_order_value, max_pos_value - pos_values.get(symbol, 0.0))
+        if available_order_value < min_order_value:
+            _log_discard("calculated available order value below minimum order value", signal, pos_size)
+            return None
+
+        contract_price = multipliers[symbol] * price
+        order_size = self._get_order_size(rating, contract_price, available_order_value)
+
+        if order_size.is_zero():
+            _log_discard("calculated order size is zero", signal, pos_size)
+            return None
+
+        # same calculation as account.contract_value, but reusing the conversion rate
+        # that was already looked up for this symbol
+        order_value = abs(multipliers[symbol] * float(order_size) * price)
+        if order_value > available:
+            _log_discard(
+                "order value above available buying power",
+                signal,
+                pos_size,
+                order_value=order_value,
+                available=available,
+            )
+            return None
+        if order_value < min_order_value:
+            _log_discard(
+                "order value below minimum order value",
+                signal,
+                pos_size,
+                order_value=order_value,
+                min_order_value=min_order_value,
+            )
+            return None
+
+        new_orders = self._get_orders(symbol, order_size, item, signal, event.time)
+        if not new_orders:
+            return None
+        return new_orders, order_value
 
     def _get_orders(self, symbol: str, size: Decimal, item: PriceItem, signal: Signal, time: datetime) -> list[Order]:
         # pylint: disable=unused-argument
@@ -226,13 +317,16 @@ class FlexTrader(Trader):
         return [Order(symbol, size)]
 
     def __repr__(self) -> str:
-        attrs = " ".join([f"{k}={v}" for k, v in self.__dict__.items() if not k.startswith("_")])
+        slots = chain.from_iterable(getattr(cls, "__slots__", ()) for cls in reversed(type(self).__mro__))
+        attrs = " ".join(f"{k}={getattr(self, k)}" for k in slots if not k.startswith("_"))
         return f"FlexTrader({attrs})"
 
 
 class FlexLimitOrderTrader(FlexTrader):
     """A FlexTrader version that returns a limit order"""
 
+    __slots__ = ("gtd_timedelta",)
+
     def __init__(
         self,
         one_order_only=True,
@@ -13,6 +13,8 @@ class Trader(ABC):
     In contrast to a `Strategy`, a `Trader` can also access the `Account` object.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def create_orders(self, signals: list[Signal], event: Event, account: Account) -> list[Order]:
         """Create zero or more orders.
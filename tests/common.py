@@ -1,8 +1,9 @@
-import math
 import pathlib
 from datetime import date, datetime, timedelta
 from unittest import TestCase
 
+import numpy as np
+
 from roboquant import PriceItem, Bar, Quote, Trade
 from roboquant.feeds import CSVFeed
 from roboquant.feeds.feed import Feed
@@ -35,6 +36,7 @@ def run_price_item_feed(feed: Feed, symbols: list[str], test_case: TestCase, tim
 
         n_items += len(event.items)
 
+        bars, trades, quotes = [], [], []
         for item in event.items:
             test_case.assertIsInstance(item, PriceItem)
             test_case.assertIn(item.symbol, symbols)
@@ -42,19 +44,25 @@ def run_price_item_feed(feed: Feed, symbols: list[str], test_case: TestCase, tim
 
             match item:
                 case Bar():
-                    ohlcv = item.ohlcv
-                    v = ohlcv[4]
-                    test_case.assertTrue(math.isnan(v) or v >= 0.0)
-                    for i in range(0, 4):
-                        test_case.assertGreaterEqual(ohlcv[1], ohlcv[i])  # High >= OHLC
-                        test_case.assertGreaterEqual(ohlcv[i], ohlcv[2])  # OHLC >= Low
+                    bars.append(item.ohlcv)
                 case Trade():
-                    test_case.assertTrue(math.isfinite(item.trade_price))
-                    test_case.assertTrue(math.isfinite(item.trade_volume))
+                    trades.append((item.trade_price, item.trade_volume))
                 case Quote():
-                    for f in item.data:
-                        test_case.assertTrue(math.isfinite(f))
-                    test_case.assertGreaterEqual(item.data[0], item.data[2])  # ask >= bid
+                    quotes.append(item.data)
+
+        # the numeric checks run vectorized over all the price-items in the event
+        if bars:
+            ohlcv = np.asarray(bars)
+            volume = ohlcv[:, 4]
+            test_case.assertTrue(bool(np.all(np.isnan(volume) | (volume >= 0.0))))
+            test_case.assertTrue(bool(np.all(ohlcv[:, 1:2] >= ohlcv[:, :4])))  # High >= OHLC
+            test_case.assertTrue(bool(np.all(ohlcv[:, :4] >= ohlcv[:, 2:3])))  # OHLC >= Low
+        if trades:
+            test_case.assertTrue(bool(np.isfinite(trades).all()))
+        if quotes:
+            data = np.asarray(quotes)
+            test_case.assertTrue(bool(np.isfinite(data).all()))
+            test_case.assertTrue(bool(np.all(data[:, 0] >= data[:, 2])))  # ask >= bid
 
     test_case.assertGreaterEqual(n_items, min_items)
 
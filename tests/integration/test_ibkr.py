@@ -1,5 +1,4 @@
 import logging
-import time
 import unittest
 from decimal import Decimal
 
@@ -23,7 +22,7 @@ class TestIBKR(unittest.TestCase):
         # Place an order
         order = Order(symbol, 10, 150.0)
         broker.place_orders([order])
-        time.sleep(5)
+        self.assertTrue(broker.wait_for_orders())
         self.assertEqual(len(account.orders), 0)
         account = broker.sync()
         self.assertEqual(len(account.orders), 1)
@@ -34,7 +33,7 @@ class TestIBKR(unittest.TestCase):
         # Update an order
         update_order = order.update(size=5, limit=160.0)
         broker.place_orders([update_order])
-        time.sleep(5)
+        self.assertTrue(broker.wait_for_orders())
         account = broker.sync()
         self.assertEqual(len(account.orders), 1)
         self.assertEqual(account.orders[0].size, Decimal(5))
@@ -44,7 +43,7 @@ class TestIBKR(unittest.TestCase):
         # Cancel an order
         cancel_order = update_order.cancel()
         broker.place_orders([cancel_order])
-        time.sleep(5)
+        self.assertTrue(broker.wait_for_orders())
         account = broker.sync()
         self.assertEqual(len(account.orders), 1)
         order = account.orders[0]